@@ -1,107 +1,140 @@
+import atexit
 import logging
+import logging.handlers
+import queue
 import random
+import re
+from collections import deque
+from dataclasses import dataclass
 from datetime import datetime
 
 # -----------------------------
 # Logging Configuration
 # -----------------------------
-logging.basicConfig(
-    level=logging.DEBUG,
-    filename="bank_log.log",
-    filemode="w",
-    format="%(asctime)s - %(levelname)s - %(message)s",
-)
+# Records go through a queue; a listener thread does the file writes
+log_queue = queue.Queue(-1)
+file_handler = logging.FileHandler("bank_log.log", mode="w", encoding="utf-8")
+file_handler.setFormatter(logging.Formatter("%(asctime)s - %(levelname)s - %(message)s"))
+log_listener = logging.handlers.QueueListener(log_queue, file_handler)
+log_listener.start()
+atexit.register(log_listener.stop)
+
+root_logger = logging.getLogger()
+root_logger.setLevel(logging.INFO)
+root_logger.addHandler(logging.handlers.QueueHandler(log_queue))
+
+# -----------------------------
+# Input Validation
+# -----------------------------
+_NAME_RE = re.compile(r"[A-Za-z]+(?: [A-Za-z]+)*")
+_DIGITS_RE = re.compile(r"[0-9]+")
+_AMOUNT_RE = re.compile(r"0*[1-9][0-9]*")    # positive whole number
+_PIN_RE = re.compile(r"[0-9]{4}")
+
+
+def _prompt(message, pattern, warning, error, transform=int):
+    """Ask until the input fully matches pattern, then return transform(value)"""
+    while True:
+        value = input(message).strip()
+        if pattern.fullmatch(value):
+            return transform(value)
+        logging.warning(warning)
+        print(error)
+
+
+# -----------------------------
+# Account Record
+# -----------------------------
+@dataclass
+class Account:
+    name: str
+    citizen: int
+    balance: int
+    pin: int
+    deposit_count: int
+    account_number: int
+
 
 # -----------------------------
 # Bank System Class
 # -----------------------------
 class PriyaBank:
     def __init__(self):
-        self.accounts = []         
-        self.citizens = []         
-        self.balances = []         
-        self.account_numbers = []  
-        self.pins = []             
-        self.deposit_count = []    
+        self.accounts = {}            # name -> Account
+        self.citizens = set()
+        # Every 4-digit number, shuffled once; new accounts pop from the front
+        self.free_numbers = deque(random.sample(range(1000, 10000), 9000))
         self.manager_pin = 3103
         self.loans = []           
 
     # Generate unique account number
     def gen_account_number(self):
-        while True:
-            number = random.randint(1000, 9999)
-            if number not in self.account_numbers:
-                self.account_numbers.append(number)
-                logging.info(f"🆕 Account number generated: {number}")
-                return number
+        if not self.free_numbers:
+            raise RuntimeError("No account numbers left")
+        number = self.free_numbers.popleft()
+        logging.info("🆕 Account number generated: %s", number)
+        return number
 
     # Open new account
     def open_account(self):
         try:
-            
             while True:
-                name = input("Enter your Full Name: ").strip()
-                if name.isalpha():
+                name = _prompt("Enter your Full Name: ", _NAME_RE,
+                               "Invalid name input ❌",
+                               "Invalid name! Please enter letters and spaces only.\n", transform=str)
+                if name not in self.accounts:
                     break
-                logging.warning("Invalid name input ❌")
-                print("Invalid name! Please enter letters only.\n")
+                logging.warning("Duplicate account name ❌")
+                print("An account with this name already exists!\n")
 
-            
             while True:
-                citizen = input("Enter your Citizenship Number: ")
-                if citizen.isdigit():
-                    citizen = int(citizen)
-                    if citizen not in self.citizens:
-                        break
-                    else:
-                        print("Citizenship number must be unique!\n")
-                logging.warning("Invalid citizenship input ❌")
-                print("Invalid input! Please enter digits only.\n")
-
-            
-            while True:
-                deposit = input("Deposit initial amount: ₹")
-                if deposit.isdigit() and int(deposit) > 0:
-                    deposit = int(deposit)
+                citizen = _prompt("Enter your Citizenship Number: ", _DIGITS_RE,
+                                  "Invalid citizenship input ❌",
+                                  "Invalid input! Please enter digits only.\n")
+                if citizen not in self.citizens:
                     break
-                logging.warning("Invalid deposit amount ❌")
-                print("Invalid input! Please enter a positive number.\n")
+                logging.warning("Duplicate citizenship number ❌")
+                print("Citizenship number must be unique!\n")
 
-            
-            while True:
-                pin = input("Create a 4-digit PIN: ")
-                if pin.isdigit() and len(pin) == 4:
-                    pin = int(pin)
-                    break
-                logging.warning("Invalid PIN input ❌")
-                print("PIN must be 4 digits!\n")
+            deposit = _prompt("Deposit initial amount: ₹", _AMOUNT_RE,
+                              "Invalid deposit amount ❌",
+                              "Invalid input! Please enter a positive number.\n")
+
+            pin = _prompt("Create a 4-digit PIN: ", _PIN_RE,
+                          "Invalid PIN input ❌",
+                          "PIN must be 4 digits!\n")
 
-            
-            self.accounts.append(name)
-            self.citizens.append(citizen)
-            self.balances.append(deposit)
-            self.pins.append(pin)
-            self.deposit_count.append(1)
             account_number = self.gen_account_number()
+            self.citizens.add(citizen)
+            self.accounts[name] = Account(
+                name=name,
+                citizen=citizen,
+                balance=deposit,
+                pin=pin,
+                deposit_count=1,
+                account_number=account_number,
+            )
 
-            logging.info(f"✅ Account created for {name} | Account No: {account_number} | Initial Deposit: ₹{deposit}")
+            logging.info("✅ Account created for %s | Account No: %s | Initial Deposit: ₹%s", name, account_number, deposit)
             print(f"\nAccount Created Successfully ✅\nName: {name}\nAccount Number: {account_number}\nBalance: ₹{deposit}\n")
         except Exception as e:
-            logging.error(f"Account creation failed ❌: {e}")
+            logging.error("Account creation failed ❌: %s", e)
 
     # Delete account
     def delete_account(self):
         try:
             name = input("Enter account name to delete: ")
-            if name in self.accounts:
-                index = self.accounts.index(name)
+            acc = self.accounts.get(name)
+            if acc is not None:
                 pin = int(input("Enter Manager PIN: "))
                 if pin == self.manager_pin:
-                    logging.info(f"🗑️ Account deleted: {name}")
-                    print(f"Account {name} deleted successfully ✅")
+                    # One dict delete, then free the citizenship and account numbers
+                    del self.accounts[name]
+                    self.citizens.discard(acc.citizen)
+                    self.free_numbers.append(acc.account_number)
                     
-                    for lst in [self.accounts, self.citizens, self.balances, self.pins, self.deposit_count, self.account_numbers]:
-                        lst.pop(index)
+                    logging.info("🗑️ Account deleted: %s", name)
+                    print(f"Account {name} deleted successfully ✅")
                 else:
                     logging.warning("Manager PIN incorrect ❌")
                     print("Wrong Manager PIN!")
@@ -109,21 +142,21 @@ class PriyaBank:
                 logging.warning("Attempt to delete non-existing account ❌")
                 print("Account not found!")
         except Exception as e:
-            logging.error(f"Account deletion failed ❌: {e}")
+            logging.error("Account deletion failed ❌: %s", e)
 
     # Deposit money
     def deposit(self):
         try:
             name = input("Enter account name: ")
-            if name in self.accounts:
-                index = self.accounts.index(name)
+            acc = self.accounts.get(name)
+            if acc is not None:
                 amount = input("Enter amount to deposit: ₹")
-                if amount.isdigit() and int(amount) > 0:
+                if _AMOUNT_RE.fullmatch(amount):
                     amount = int(amount)
-                    self.balances[index] += amount
-                    self.deposit_count[index] += 1
-                    logging.info(f"💰 ₹{amount} deposited to {name} | New Balance: ₹{self.balances[index]}")
-                    print(f"₹{amount} deposited successfully ✅ | Current Balance: ₹{self.balances[index]}")
+                    acc.balance += amount
+                    acc.deposit_count += 1
+                    logging.info("💰 ₹%s deposited to %s | New Balance: ₹%s", amount, name, acc.balance)
+                    print(f"₹{amount} deposited successfully ✅ | Current Balance: ₹{acc.balance}")
                 else:
                     logging.warning("Invalid deposit amount ❌")
                     print("Invalid amount!")
@@ -131,24 +164,24 @@ class PriyaBank:
                 logging.warning("Deposit to non-existing account ❌")
                 print("Account not found!")
         except Exception as e:
-            logging.error(f"Deposit failed ❌: {e}")
+            logging.error("Deposit failed ❌: %s", e)
 
     # Withdraw money
     def withdraw(self):
         try:
             name = input("Enter account name: ")
-            if name in self.accounts:
-                index = self.accounts.index(name)
-                if self.balances[index] <= 300:
+            acc = self.accounts.get(name)
+            if acc is not None:
+                if acc.balance <= 300:
                     print("❌ Withdrawals not allowed below ₹300 balance")
                     return
                 pin = int(input("Enter your 4-digit PIN: "))
-                if pin == self.pins[index]:
+                if pin == acc.pin:
                     amount = int(input("Enter amount to withdraw: ₹"))
-                    if 0 < amount <= self.balances[index]:
-                        self.balances[index] -= amount
-                        logging.info(f"💸 ₹{amount} withdrawn from {name} | Remaining Balance: ₹{self.balances[index]}")
-                        print(f"₹{amount} withdrawn successfully ✅ | Remaining Balance: ₹{self.balances[index]}")
+                    if 0 < amount <= acc.balance:
+                        acc.balance -= amount
+                        logging.info("💸 ₹%s withdrawn from %s | Remaining Balance: ₹%s", amount, name, acc.balance)
+                        print(f"₹{amount} withdrawn successfully ✅ | Remaining Balance: ₹{acc.balance}")
                     else:
                         logging.warning("Withdrawal failed due to insufficient funds ❌")
                         print("Insufficient balance or invalid amount!")
@@ -159,18 +192,18 @@ class PriyaBank:
                 logging.warning("Withdrawal attempt on non-existing account ❌")
                 print("Account not found!")
         except Exception as e:
-            logging.error(f"Withdrawal failed ❌: {e}")
+            logging.error("Withdrawal failed ❌: %s", e)
 
     # Check balance
     def check_balance(self):
         try:
             name = input("Enter account name: ")
-            if name in self.accounts:
-                index = self.accounts.index(name)
+            acc = self.accounts.get(name)
+            if acc is not None:
                 pin = int(input("Enter your 4-digit PIN: "))
-                if pin == self.pins[index]:
-                    logging.info(f"🔎 Balance checked for {name} | Balance: ₹{self.balances[index]}")
-                    print(f"Account Name: {name}\nBalance: ₹{self.balances[index]}")
+                if pin == acc.pin:
+                    logging.info("🔎 Balance checked for %s | Balance: ₹%s", name, acc.balance)
+                    print(f"Account Name: {name}\nBalance: ₹{acc.balance}")
                 else:
                     logging.warning("Incorrect PIN ❌")
                     print("Wrong PIN!")
@@ -178,21 +211,21 @@ class PriyaBank:
                 logging.warning("Balance check for non-existing account ❌")
                 print("Account not found!")
         except Exception as e:
-            logging.error(f"Balance check failed ❌: {e}")
+            logging.error("Balance check failed ❌: %s", e)
 
     # Apply for loan
     def apply_loan(self):
         try:
             name = input("Enter account name: ")
-            if name in self.accounts:
-                index = self.accounts.index(name)
-                if self.deposit_count[index] < 10:
+            acc = self.accounts.get(name)
+            if acc is not None:
+                if acc.deposit_count < 10:
                     print("❌ Loans allowed only after at least 10 deposits")
                     return
                 amount = int(input("Enter loan amount (Max ₹5,00,000): ₹"))
                 if 0 < amount <= 500000:
                     self.loans.append(amount)
-                    logging.info(f"🏦 Loan approved for {name} | Amount: ₹{amount}")
+                    logging.info("🏦 Loan approved for %s | Amount: ₹%s", name, amount)
                     print(f"Loan of ₹{amount} approved ✅")
                 else:
                     logging.warning("Loan application exceeds limit ❌")
@@ -201,21 +234,21 @@ class PriyaBank:
                 logging.warning("Loan application for non-existing account ❌")
                 print("Account not found!")
         except Exception as e:
-            logging.error(f"Loan application failed ❌: {e}")
+            logging.error("Loan application failed ❌: %s", e)
 
     def change_pin (self):
         try:
             name = input("Enter account name : ")
-            if name in self.accounts :
-                index = self.accounts.index(name)
+            acc = self.accounts.get(name)
+            if acc is not None:
                 pin = int(input("Enter manager pin : "))
                 if pin == self.manager_pin:
                     new = input("Enter new pin : ")
-                    if new.isdigit() and len(new) == 4:
+                    if _PIN_RE.fullmatch(new):
                         new = int(new)
-                        self.pins[index] = new
+                        acc.pin = new
                         print("Pin change successfully✅")
-                        logging.info(f"Pin changed for aacount: {name}")
+                        logging.info("Pin changed for aacount: %s", name)
                     else:
                         print("Please enter valid pin!")
                 else: 
@@ -232,16 +265,17 @@ class PriyaBank:
 
 bank = PriyaBank()
 
-menu_options = {
-    "1": bank.open_account,
-    "2": bank.delete_account,
-    "3": bank.deposit,
-    "4": bank.withdraw,
-    "5": bank.apply_loan,
-    "6": bank.check_balance,
-    "7": bank.change_pin,
-    "8": exit
-}
+# Menu choice N runs menu_options[N - 1]
+menu_options = (
+    bank.open_account,
+    bank.delete_account,
+    bank.deposit,
+    bank.withdraw,
+    bank.apply_loan,
+    bank.check_balance,
+    bank.change_pin,
+    exit,
+)
 
 print("💳 _ _ _ Priya Bank Limited _ _ _ 💳")
 
@@ -256,7 +290,11 @@ while True:
     print("8. Exit\n")
 
     choice = input("Enter your choice: ")
-    if choice in menu_options:
-        menu_options[choice]()
+    try:
+        index = int(choice)
+    except ValueError:
+        index = 0
+    if 1 <= index <= len(menu_options):
+        menu_options[index - 1]()
     else:
         print("❌ Invalid choice! Please select from 1-8")
@@ -2,10 +2,15 @@ import cv2
 import numpy as np
 import time
 import os
+import queue
 import subprocess
 import sys
+import traceback
 from collections import deque
-from threading import Thread
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from enum import IntEnum
+from threading import Event, Thread
 
 # Try to import pygame for audio
 AUDIO_AVAILABLE = False
@@ -18,6 +23,12 @@ try:
 except ImportError:
     pass
 
+# winsound ships with Python on Windows only
+try:
+    import winsound
+except ImportError:
+    winsound = None
+
 # If pygame fails for M4A, try using system commands as fallback
 if not AUDIO_AVAILABLE:
     # Check if we can use Windows Media Player via PowerShell
@@ -30,6 +41,15 @@ if not AUDIO_AVAILABLE:
     print("Warning: No audio playback method available.")
     print("Install pygame with: pip install pygame")
 
+# Try to import numba for JIT-compiled pixel loops (optional)
+NUMBA_AVAILABLE = False
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    pass
+
 
 # ============================================================================
 # CONFIGURATION
@@ -43,13 +63,18 @@ CAMERA_HEIGHT = 480
 # Display settings
 DISPLAY_WIDTH = 854
 DISPLAY_HEIGHT = 480
+MIRROR_DISPLAY = True         # Show the camera feed mirrored (detection is unaffected)
 
 # Alarm display settings
 ALARM_DISPLAY_WIDTH = 600
 ALARM_DISPLAY_HEIGHT = 400
+SINGLE_WINDOW = False         # Show both views side by side in one window (one imshow per frame)
 
 # Fire detection settings
 FIRE_MIN_AREA = 500          # Minimum contour area to consider as fire
+DETECTION_SCALE = 2          # Run detection on a frame downsampled by this factor
+DETECT_EVERY = 3             # Run full detection every Nth frame, reuse result in between
+USE_OPENCL = False           # Offload the mask pipeline to the GPU via OpenCV's T-API
 CONSECUTIVE_FRAMES = 1        # Frames of fire detection before triggering alarm
 COOLDOWN_FRAMES = 30          # Frames without fire before stopping alarm
 
@@ -64,17 +89,70 @@ FIRE_HSV_RANGES = [
     {'lower': np.array([170, 100, 200]), 'upper': np.array([180, 255, 255])},
 ]
 
+# Same ranges stacked into contiguous (N, 3) arrays, built once at import
+FIRE_LOWERS = np.asarray([r['lower'] for r in FIRE_HSV_RANGES], dtype=np.uint8)
+FIRE_UPPERS = np.asarray([r['upper'] for r in FIRE_HSV_RANGES], dtype=np.uint8)
+
 # Audio settings - using M4A audio file
 ALARM_SOUND_PATH = os.path.join(os.path.dirname(__file__), "aag_audio.m4a")
+ALARM_SOUND_EXISTS = os.path.isfile(ALARM_SOUND_PATH)  # Checked once at startup
+
+
+# ============================================================================
+# NUMBA KERNELS (used only when numba is installed)
+# ============================================================================
+
+if NUMBA_AVAILABLE:
+    @njit(parallel=True, cache=True)
+    def _fire_mask(hsv, hsv_lut, out):
+        """Write 255 where a pixel falls in any fire range, else 0 (one pass)"""
+        for y in prange(hsv.shape[0]):
+            for x in range(hsv.shape[1]):
+                out[y, x] = (hsv_lut[0, hsv[y, x, 0], 0]
+                             & hsv_lut[0, hsv[y, x, 1], 1]
+                             & hsv_lut[0, hsv[y, x, 2], 2])
+    
+    @njit(cache=True)
+    def _scale_clip_boxes(boxes, sx, sy, width, height):
+        """Scale (x, y, w, h) boxes to (x0, y0, x1, y1) corners clipped to the display"""
+        out = np.empty((boxes.shape[0], 4), dtype=np.int32)
+        for i in range(boxes.shape[0]):
+            x0 = int(boxes[i, 0] * sx)
+            y0 = int(boxes[i, 1] * sy)
+            out[i, 0] = min(max(x0, 0), width)
+            out[i, 1] = min(max(y0, 0), height)
+            out[i, 2] = min(max(x0 + int(boxes[i, 2] * sx), 0), width)
+            out[i, 3] = min(max(y0 + int(boxes[i, 3] * sy), 0), height)
+        return out
 
 
 # ============================================================================
 # CAMERA SELECTION HELPER
 # ============================================================================
 
+def _probe_camera(index):
+    """
+    Try to open a single camera index.
+    
+    Returns:
+        (index, camera_name) if the camera opened, else (index, None)
+    """
+    cap = cv2.VideoCapture(index)
+    camera_name = None
+    if cap.isOpened():
+        # Try to get camera name/backend info
+        backend = cap.getBackendName()
+        width = int(cap.get(cv2.CAP_PROP_FRAME_WIDTH))
+        height = int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
+        camera_name = f"Camera {index} ({backend}) - {width}x{height}"
+    cap.release()
+    return index, camera_name
+
+
 def list_available_cameras(max_cameras=10):
     """
     Scan for available cameras and return a list of (index, name) tuples.
+    Indices are probed concurrently since each open can block for a while.
     
     Args:
         max_cameras: Maximum number of camera indices to check
@@ -82,24 +160,13 @@ def list_available_cameras(max_cameras=10):
     Returns:
         List of tuples: [(index, camera_name), ...]
     """
-    available_cameras = []
-    
     print("\nScanning for available cameras...")
     
-    for index in range(max_cameras):
-        cap = cv2.VideoCapture(index)
-        if cap.isOpened():
-            # Try to get camera name/backend info
-            backend = cap.getBackendName()
-            width = int(cap.get(cv2.CAP_PROP_FRAME_WIDTH))
-            height = int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
-            camera_name = f"Camera {index} ({backend}) - {width}x{height}"
-            available_cameras.append((index, camera_name))
-            cap.release()
-        else:
-            cap.release()
+    with ThreadPoolExecutor(max_workers=max_cameras) as executor:
+        results = list(executor.map(_probe_camera, range(max_cameras)))
     
-    return available_cameras
+    # executor.map preserves input order, so results are already sorted by index
+    return [(index, name) for index, name in results if name is not None]
 
 
 def select_camera():
@@ -153,6 +220,32 @@ def select_camera():
             sys.exit(0)
 
 
+# ============================================================================
+# DETECTION RESULT
+# ============================================================================
+
+@dataclass
+class DetectionResult:
+    """
+    Output of one fire detection pass.
+    
+    Boxes are kept as a single (N, 4) int32 array of (x, y, w, h) rows in
+    frame coordinates so consumers can scale them without Python loops.
+    mask and hsv are NumPy arrays at detection scale owned by this result,
+    so they stay valid while the next detection runs on another thread.
+    """
+    boxes_xywh: np.ndarray
+    confidence: float
+    fire_area: float
+    mask: np.ndarray = None
+    hsv: np.ndarray = None
+    
+    @property
+    def fire_detected(self) -> bool:
+        """True when at least one fire region was found"""
+        return self.boxes_xywh.shape[0] > 0
+
+
 # ============================================================================
 # FIRE DETECTOR CLASS
 # ============================================================================
@@ -167,70 +260,154 @@ class FireDetector:
         self.detection_history = deque(maxlen=CONSECUTIVE_FRAMES)
         self.last_detection_time = 0
         
-    def detect(self, frame: np.ndarray) -> dict:
+        # Temporal frame skipping: only every DETECT_EVERY-th frame is processed
+        self.frame_ctr = 0
+        self.last_result = None
+        
+        # HSV image of the last processed frame, shared with renderers
+        self.last_hsv = None
+        
+        # Structuring element, built once and reused
+        self.kernel = cv2.getStructuringElement(cv2.MORPH_ELLIPSE, (5, 5))
+        
+        # The fire ranges only differ in hue and share their S/V bounds, so the
+        # whole union is precomputed as one per-channel lookup table (1x256x3):
+        # channel 0 marks fire hues, channels 1/2 mark the S/V range
+        self.hsv_lut = np.zeros((1, 256, 3), dtype=np.uint8)
+        for lower, upper in zip(FIRE_LOWERS.tolist(), FIRE_UPPERS.tolist()):
+            self.hsv_lut[0, lower[0]:upper[0] + 1, 0] = 255
+        for channel in (1, 2):
+            lower, upper = int(FIRE_LOWERS[0][channel]), int(FIRE_UPPERS[0][channel])
+            self.hsv_lut[0, lower:upper + 1, channel] = 255
+        self.lut_all = np.array([255, 255, 255], dtype=np.uint8)
+        
+        # Compile the numba kernel now so the first real frame isn't delayed
+        if NUMBA_AVAILABLE:
+            dummy = np.zeros((2, 2, 3), dtype=np.uint8)
+            _fire_mask(dummy, self.hsv_lut, np.zeros((2, 2), dtype=np.uint8))
+        
+        # GPU offload through cv2.UMat when OpenCL is requested and present
+        self.use_opencl = USE_OPENCL and cv2.ocl.haveOpenCL()
+        if self.use_opencl:
+            cv2.ocl.setUseOpenCL(True)
+            print("✓ Fire detection using OpenCL")
+        
+        # Detection-sized buffers, reused across frames
+        self._buf_shape = None
+        self._ensure_buffers((CAMERA_HEIGHT // DETECTION_SCALE, CAMERA_WIDTH // DETECTION_SCALE))
+    
+    def _ensure_buffers(self, shape: tuple):
         """
-        Detect fire in the given frame.
+        (Re)allocate the working buffers for a given (height, width).
+        Only happens when the camera delivers a different size than before,
+        so the per-frame path stays allocation-free.
+        """
+        if shape == self._buf_shape:
+            return
+        self._buf_shape = shape
+        self._small_buf = np.zeros(shape + (3,), dtype=np.uint8)
+        self._flags_buf = np.zeros(shape + (3,), dtype=np.uint8)
+        self._mask_buf = np.zeros(shape, dtype=np.uint8)
+        self._tmp_buf = np.zeros(shape, dtype=np.uint8)
         
-        Returns:
-            dict with keys:
-                - fire_detected: bool
-                - confidence: float (0-1)
-                - bounding_boxes: list of (x, y, w, h)
-                - mask: binary mask of fire regions
-                - fire_area: total fire pixel area
+    def detect(self, frame: np.ndarray) -> DetectionResult:
         """
-        # Convert to HSV color space
-        hsv = cv2.cvtColor(frame, cv2.COLOR_BGR2HSV)
+        Detect fire in the given frame.
         
-        # Create combined mask from all fire color ranges
-        combined_mask = np.zeros(frame.shape[:2], dtype=np.uint8)
+        Returns:
+            DetectionResult with the fire boxes, confidence (0-1), total fire
+            pixel area, and the mask and HSV image used for detection
         
-        for hsv_range in FIRE_HSV_RANGES:
-            mask = cv2.inRange(hsv, hsv_range['lower'], hsv_range['upper'])
-            combined_mask = cv2.bitwise_or(combined_mask, mask)
+        Fire evolves slowly compared to the frame rate, so between decision
+        frames the previous result is returned and history is not updated.
+        """
+        self.frame_ctr += 1
+        if self.frame_ctr % DETECT_EVERY != 0 and self.last_result is not None:
+            return self.last_result
         
-        # Apply morphological operations to clean up the mask
-        kernel = cv2.getStructuringElement(cv2.MORPH_ELLIPSE, (5, 5))
-        combined_mask = cv2.morphologyEx(combined_mask, cv2.MORPH_CLOSE, kernel)
-        combined_mask = cv2.morphologyEx(combined_mask, cv2.MORPH_OPEN, kernel)
+        # Fire regions are large blobs, so detect on a downsampled copy
+        scale = DETECTION_SCALE
+        small_size = (frame.shape[1] // scale, frame.shape[0] // scale)
         
-        # Apply Gaussian blur to smooth edges
-        combined_mask = cv2.GaussianBlur(combined_mask, (5, 5), 0)
-        _, combined_mask = cv2.threshold(combined_mask, 127, 255, cv2.THRESH_BINARY)
+        if self.use_opencl:
+            combined_mask = self._build_mask_opencl(frame, small_size)
+        else:
+            combined_mask = self._build_mask(frame, small_size)
         
-        # Find contours
+        # Find contours (CPU only)
         contours, _ = cv2.findContours(
             combined_mask, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE
         )
         
-        # Filter contours by area and get bounding boxes
-        bounding_boxes = []
+        # Filter contours by area and get bounding boxes (in frame coordinates)
+        boxes = []
         total_fire_area = 0
+        min_area = FIRE_MIN_AREA / (scale * scale)
         
         for contour in contours:
             area = cv2.contourArea(contour)
-            if area >= FIRE_MIN_AREA:
-                x, y, w, h = cv2.boundingRect(contour)
-                bounding_boxes.append((x, y, w, h))
+            if area >= min_area:
+                boxes.append(cv2.boundingRect(contour))
                 total_fire_area += area
         
+        bounding_boxes = np.array(boxes, dtype=np.int32).reshape(-1, 4) * scale
+        total_fire_area *= scale * scale
+        
         # Calculate confidence based on fire area relative to frame
         frame_area = frame.shape[0] * frame.shape[1]
         confidence = min(total_fire_area / (frame_area * 0.1), 1.0)  # Cap at 100%
         
-        # Determine if fire is detected
-        fire_detected = len(bounding_boxes) > 0
+        self.last_result = DetectionResult(
+            boxes_xywh=bounding_boxes,
+            confidence=confidence,
+            fire_area=total_fire_area,
+            mask=combined_mask,
+            hsv=self.last_hsv,
+        )
         
         # Update detection history
-        self.detection_history.append(fire_detected)
-        
-        return {
-            'fire_detected': fire_detected,
-            'confidence': confidence,
-            'bounding_boxes': bounding_boxes,
-            'mask': combined_mask,
-            'fire_area': total_fire_area
-        }
+        self.detection_history.append(self.last_result.fire_detected)
+        return self.last_result
+    
+    def _build_mask(self, frame: np.ndarray, small_size: tuple) -> np.ndarray:
+        """Build the cleaned fire mask on the CPU using the reusable buffers"""
+        small_w, small_h = small_size
+        self._ensure_buffers((small_h, small_w))
+        small = cv2.resize(frame, small_size,
+                           dst=self._small_buf, interpolation=cv2.INTER_AREA)
+        
+        # Convert to HSV color space; written to a fresh array because the
+        # result keeps it after the next detection starts
+        hsv = cv2.cvtColor(small, cv2.COLOR_BGR2HSV)
+        self.last_hsv = hsv
+        
+        # Create combined mask from all fire color ranges: the HSV image is
+        # read once through the per-channel LUT, then all three flags are ANDed
+        if NUMBA_AVAILABLE:
+            combined_mask = self._mask_buf
+            _fire_mask(hsv, self.hsv_lut, combined_mask)
+        else:
+            flags = cv2.LUT(hsv, self.hsv_lut, dst=self._flags_buf)
+            combined_mask = cv2.inRange(flags, self.lut_all, self.lut_all, dst=self._mask_buf)
+        
+        # Apply morphological operations to clean up the mask
+        # (output is already binary, so no extra blur/re-threshold pass).
+        # The final pass allocates, so the returned mask is the result's own
+        closed = cv2.morphologyEx(combined_mask, cv2.MORPH_CLOSE, self.kernel, dst=self._tmp_buf)
+        return cv2.morphologyEx(closed, cv2.MORPH_OPEN, self.kernel)
+    
+    def _build_mask_opencl(self, frame: np.ndarray, small_size: tuple) -> np.ndarray:
+        """Build the cleaned fire mask on the GPU; only the final mask is downloaded"""
+        small = cv2.resize(cv2.UMat(frame), small_size, interpolation=cv2.INTER_AREA)
+        hsv = cv2.cvtColor(small, cv2.COLOR_BGR2HSV)
+        
+        flags = cv2.LUT(hsv, self.hsv_lut)
+        combined_mask = cv2.inRange(flags, self.lut_all, self.lut_all)
+        
+        combined_mask = cv2.morphologyEx(combined_mask, cv2.MORPH_CLOSE, self.kernel)
+        combined_mask = cv2.morphologyEx(combined_mask, cv2.MORPH_OPEN, self.kernel)
+        self.last_hsv = hsv.get()  # Downloaded so both paths return an ndarray
+        return combined_mask.get()
     
     def is_fire_confirmed(self) -> bool:
         """
@@ -244,31 +421,45 @@ class FireDetector:
     def reset(self):
         """Reset detection history"""
         self.detection_history.clear()
+        self.frame_ctr = 0
+        self.last_result = None
+        self.last_hsv = None
 
 
 # ============================================================================
 # ALARM MANAGER CLASS
 # ============================================================================
 
+class AlarmState(IntEnum):
+    """Alarm lifecycle states"""
+    IDLE = 0        # No alarm
+    ALARMING = 1    # Alarm on, fire still confirmed
+    COOLING = 2     # Alarm on, counting fire-free frames before stopping
+
+
 class AlarmManager:
     """
     Manages the alarm state and audio playback.
     Supports multiple audio methods: pygame, Windows native
     """
     
-    def __init__(self, sound_path: str):
+    def __init__(self, sound_path: str, sound_exists: bool = None):
         self.sound_path = sound_path
         self.is_playing = False
-        self.alarm_active = False
+        self.state = AlarmState.IDLE
         self.sound_enabled = True
         self.no_fire_counter = 0
         self.audio_process = None  # For Windows native playback
-        self.audio_thread = None
+        self.winsound_playing = False
         
         # Load alarm sound based on available method
         self.sound_loaded = False
+        self.sound_obj = None  # Decoded pygame Sound, when the format allows it
         
-        if not os.path.exists(sound_path):
+        if sound_exists is None:
+            sound_exists = os.path.isfile(sound_path)
+        
+        if not sound_exists:
             print(f"Warning: Alarm sound file not found: {sound_path}")
             print("Place 'aag_audio.m4a' in the fire folder for audio alerts.")
             return
@@ -278,7 +469,12 @@ class AlarmManager:
                 # Initialize pygame mixer with settings that work better for various formats
                 pygame.mixer.quit()
                 pygame.mixer.init(frequency=44100, size=-16, channels=2, buffer=2048)
-                pygame.mixer.music.load(sound_path)
+                try:
+                    # Decode once up front so each trigger just replays the buffer
+                    self.sound_obj = pygame.mixer.Sound(sound_path)
+                except Exception:
+                    # Formats Sound can't decode (e.g. M4A) are streamed instead
+                    pygame.mixer.music.load(sound_path)
                 self.sound_loaded = True
                 print(f"✓ Alarm sound loaded (pygame): {sound_path}")
             except Exception as e:
@@ -293,34 +489,52 @@ class AlarmManager:
             self.sound_loaded = True
             print(f"✓ Alarm sound ready (Windows native): {sound_path}")
     
-    def trigger_alarm(self):
-        """Start the alarm"""
-        if not self.alarm_active:
-            self.alarm_active = True
-            self.no_fire_counter = 0
+    @property
+    def alarm_active(self) -> bool:
+        """True while the alarm is on (alarming or cooling down)"""
+        return self.state != AlarmState.IDLE
+    
+    def _transition(self, new_state: AlarmState):
+        """
+        Move to a new state. Audio is only started/stopped when the alarm
+        turns on or off, so callers never re-check the audio flags.
+        """
+        old_state = self.state
+        self.state = new_state
+        if old_state == AlarmState.IDLE and new_state != AlarmState.IDLE:
             print("🔥 FIRE ALARM TRIGGERED!")
             self._play_sound()
+        elif old_state != AlarmState.IDLE and new_state == AlarmState.IDLE:
+            print("✓ Alarm stopped - System normal")
+            self._stop_sound()
+    
+    def trigger_alarm(self):
+        """Start the alarm"""
+        self.no_fire_counter = 0
+        if self.state != AlarmState.ALARMING:
+            self._transition(AlarmState.ALARMING)
     
     def stop_alarm(self):
         """Stop the alarm"""
-        if self.alarm_active:
-            self.alarm_active = False
-            print("✓ Alarm stopped - System normal")
-            self._stop_sound()
+        if self.state != AlarmState.IDLE:
+            self._transition(AlarmState.IDLE)
     
     def update(self, fire_confirmed: bool):
         """
         Update alarm state based on fire detection.
         Implements hysteresis to prevent rapid on/off switching.
         """
+        state = self.state
         if fire_confirmed:
             self.no_fire_counter = 0
-            self.trigger_alarm()
-        else:
-            if self.alarm_active:
-                self.no_fire_counter += 1
-                if self.no_fire_counter >= COOLDOWN_FRAMES:
-                    self.stop_alarm()
+            if state != AlarmState.ALARMING:
+                self._transition(AlarmState.ALARMING)
+        elif state != AlarmState.IDLE:
+            self.no_fire_counter += 1
+            if self.no_fire_counter >= COOLDOWN_FRAMES:
+                self._transition(AlarmState.IDLE)
+            elif state == AlarmState.ALARMING:
+                self._transition(AlarmState.COOLING)
     
     def _play_sound(self):
         """Play alarm sound (loops continuously)"""
@@ -330,7 +544,10 @@ class AlarmManager:
         try:
             if AUDIO_METHOD == "pygame":
                 try:
-                    pygame.mixer.music.play(-1)  # -1 = loop indefinitely
+                    if self.sound_obj is not None:
+                        self.sound_obj.play(loops=-1)  # -1 = loop indefinitely
+                    else:
+                        pygame.mixer.music.play(-1)
                     self.is_playing = True
                 except:
                     # Fall back to Windows native
@@ -341,38 +558,66 @@ class AlarmManager:
             print(f"Error playing sound: {e}")
     
     def _play_windows_audio(self):
-        """Play audio using Windows Media Player via PowerShell (loops)"""
+        """
+        Play audio natively on Windows (loops until stopped).
+        Uses a single long-lived player for the whole alarm instead of
+        restarting one every few seconds.
+        """
         if self.is_playing:
             return
         
-        self.is_playing = True
+        # WAV files can loop asynchronously inside the OS sound API
+        if winsound is not None and self.sound_path.lower().endswith(".wav"):
+            try:
+                winsound.PlaySound(
+                    self.sound_path,
+                    winsound.SND_FILENAME | winsound.SND_ASYNC | winsound.SND_LOOP
+                )
+                self.winsound_playing = True
+                self.is_playing = True
+                return
+            except Exception as e:
+                print(f"winsound error: {e}")
         
-        def play_loop():
-            while self.is_playing and self.alarm_active:
-                try:
-                    # Use PowerShell to play the audio file
-                    cmd = f'''
-                    Add-Type -AssemblyName presentationCore
-                    $player = New-Object System.Windows.Media.MediaPlayer
-                    $player.Open("{self.sound_path}")
-                    $player.Play()
-                    Start-Sleep -Seconds 10
-                    $player.Stop()
-                    $player.Close()
-                    '''
-                    self.audio_process = subprocess.Popen(
-                        ["powershell", "-Command", cmd],
-                        stdout=subprocess.DEVNULL,
-                        stderr=subprocess.DEVNULL,
-                        creationflags=subprocess.CREATE_NO_WINDOW if hasattr(subprocess, 'CREATE_NO_WINDOW') else 0
-                    )
-                    self.audio_process.wait()
-                except Exception as e:
-                    print(f"Windows audio error: {e}")
-                    break
+        creationflags = subprocess.CREATE_NO_WINDOW if hasattr(subprocess, 'CREATE_NO_WINDOW') else 0
         
-        self.audio_thread = Thread(target=play_loop, daemon=True)
-        self.audio_thread.start()
+        try:
+            # ffplay loops the file itself (-loop 0) in one process
+            self.audio_process = subprocess.Popen(
+                ["ffplay", "-nodisp", "-autoexit", "-loop", "0",
+                 "-loglevel", "quiet", self.sound_path],
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                creationflags=creationflags
+            )
+            self.is_playing = True
+            return
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            print(f"ffplay error: {e}")
+        
+        try:
+            # Fall back to one PowerShell MediaPlayer that rewinds in a loop
+            cmd = f'''
+            Add-Type -AssemblyName presentationCore
+            $player = New-Object System.Windows.Media.MediaPlayer
+            $player.Open("{self.sound_path}")
+            while ($true) {{
+                $player.Position = [TimeSpan]::Zero
+                $player.Play()
+                Start-Sleep -Seconds 10
+            }}
+            '''
+            self.audio_process = subprocess.Popen(
+                ["powershell", "-Command", cmd],
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                creationflags=creationflags
+            )
+            self.is_playing = True
+        except Exception as e:
+            print(f"Windows audio error: {e}")
     
     def _stop_sound(self):
         """Stop alarm sound"""
@@ -382,11 +627,21 @@ class AlarmManager:
         try:
             if AUDIO_METHOD == "pygame":
                 try:
-                    pygame.mixer.music.stop()
+                    if self.sound_obj is not None:
+                        self.sound_obj.stop()
+                    else:
+                        pygame.mixer.music.stop()
                 except:
                     pass
             
-            # Stop Windows audio process if running
+            # Stop Windows audio if running
+            if self.winsound_playing:
+                try:
+                    winsound.PlaySound(None, 0)
+                except:
+                    pass
+                self.winsound_playing = False
+            
             if self.audio_process:
                 try:
                     self.audio_process.terminate()
@@ -410,10 +665,103 @@ class AlarmManager:
     def cleanup(self):
         """Clean up audio resources"""
         self._stop_sound()
-        if AUDIO_AVAILABLE:
+        if AUDIO_METHOD == "pygame":
             pygame.mixer.quit()
 
 
+# ============================================================================
+# DRAWING HELPERS
+# ============================================================================
+
+# Font and BGR colors used by both renderers
+FONT = cv2.FONT_HERSHEY_SIMPLEX
+
+WHITE = (255, 255, 255)
+SILVER = (200, 200, 200)
+LIGHT_GRAY = (180, 180, 180)
+MID_GRAY = (150, 150, 150)
+GRAY = (120, 120, 120)
+DIM_GRAY = (100, 100, 100)
+DARK_GRAY = (60, 60, 60)
+
+RED = (0, 0, 255)
+DARK_RED = (0, 0, 150)
+LIGHT_RED = (100, 100, 255)
+MUTED_RED = (100, 100, 200)
+
+ORANGE = (0, 165, 255)
+ORANGE_RED = (0, 100, 255)
+DIM_ORANGE_RED = (0, 50, 200)
+DARK_ORANGE = (0, 100, 200)
+BURNT_ORANGE = (0, 50, 150)
+YELLOW = (0, 200, 255)
+PALE_YELLOW = (150, 255, 255)
+
+GREEN = (100, 200, 100)
+LIGHT_GREEN = (100, 255, 100)
+DARK_GREEN = (50, 100, 50)
+
+STEEL_BLUE = (180, 150, 100)
+
+
+def prerender_text(text: str, org: tuple, font_scale: float, color: tuple,
+                   thickness: int, bounds: tuple) -> tuple:
+    """
+    Rasterize static text once so it can be stamped onto frames later.
+    
+    Args:
+        org: text origin (x, y) on the target canvas, as for cv2.putText
+        bounds: (height, width) of the target canvas, used for clipping
+        
+    Returns:
+        (y0, x0, mask, color) - text coverage cropped to its bounding box
+    """
+    (text_w, text_h), baseline = cv2.getTextSize(text, FONT, font_scale, thickness)
+    y0 = max(org[1] - text_h - thickness, 0)
+    x0 = max(org[0] - thickness, 0)
+    y1 = min(org[1] + baseline + thickness, bounds[0])
+    x1 = min(org[0] + text_w + thickness, bounds[1])
+    
+    mask = np.zeros((y1 - y0, x1 - x0), dtype=np.uint8)
+    local_org = (org[0] - x0, org[1] - y0)
+    cv2.putText(mask, text, local_org, FONT, font_scale, 255, thickness)
+    return y0, x0, mask[:, :, None] > 0, np.array(color, dtype=np.uint8)
+
+
+def blit_text(canvas: np.ndarray, sprite: tuple):
+    """Stamp text pre-rendered by prerender_text onto canvas (in place)"""
+    y0, x0, mask, color = sprite
+    roi = canvas[y0:y0 + mask.shape[0], x0:x0 + mask.shape[1]]
+    np.copyto(roi, color, where=mask)
+
+
+def prerender_label(text: str, font_scale: float, thickness: int,
+                    text_color: tuple, fill_color: tuple) -> np.ndarray:
+    """
+    Rasterize a text label on a solid background once, as drawn by a filled
+    cv2.rectangle 25 px tall followed by cv2.putText 7 px above its bottom.
+    
+    Returns:
+        (H, W, 3) uint8 image of the whole label
+    """
+    text_w, _ = cv2.getTextSize(text, FONT, font_scale, thickness)[0]
+    label = np.empty((26, text_w + 11, 3), dtype=np.uint8)
+    label[:] = fill_color
+    cv2.putText(label, text, (5, 18), FONT,
+                font_scale, text_color, thickness)
+    return label
+
+
+def blit_image(canvas: np.ndarray, image: np.ndarray, x0: int, y0: int):
+    """Copy image onto canvas with its top-left corner at (x0, y0), clipped to the canvas"""
+    h, w = image.shape[:2]
+    cy0, cx0 = max(y0, 0), max(x0, 0)
+    cy1, cx1 = min(y0 + h, canvas.shape[0]), min(x0 + w, canvas.shape[1])
+    if cy0 >= cy1 or cx0 >= cx1:
+        return
+    canvas[cy0:cy1, cx0:cx1] = image[cy0 - y0:cy1 - y0, cx0 - x0:cx1 - x0]
+
+
 # ============================================================================
 # CAMERA VIEW RENDERER (SCREEN 1)
 # ============================================================================
@@ -424,50 +772,89 @@ class CameraViewRenderer:
     Shows: Camera + bounding boxes + detection status
     """
     
-    def __init__(self, width: int, height: int):
+    def __init__(self, width: int, height: int, mirror: bool = MIRROR_DISPLAY):
         self.width = width
         self.height = height
+        self.mirror = mirror
         self.flash_state = False
         self.flash_counter = 0
+        
+        # Static HUD text, rasterized once
+        bounds = (height, width)
+        self._title_text = prerender_text("FIRE DETECTION - CAMERA FEED", (15, 35),
+                                          0.7, WHITE, 2, bounds)
+        self._controls_text = prerender_text("Q:Quit  S:Sound  R:Reset",
+                                             (width - 200, height - 70 + 50),
+                                             0.35, GRAY, 1, bounds)
+        
+        # The box label is always "FIRE", so rasterize it once per box color
+        self._label_sprites = {
+            color: prerender_label("FIRE", 0.6, 2, WHITE, color)
+            for color in [ORANGE, RED, ORANGE_RED]
+        }
+        
+        # (thickness, color) of an alarm box for each 5-frame pulse phase
+        self._alarm_box_styles = ((3, RED), (2, RED), (3, ORANGE_RED), (2, ORANGE_RED))
+        
+        # Constant backgrounds blended into the header and footer strips.
+        # The header covers rows 0..60 inclusive, the footer the last 70 rows.
+        self._footer_y = height - 70
+        self._header_bg = np.full((min(61, height), width, 3), 30, dtype=np.uint8)
+        self._footer_bg = np.full((height - self._footer_y, width, 3), 30, dtype=np.uint8)
+        
+        # Persistent render target the camera frame is resized into
+        self._display_buf = np.empty((height, width, 3), dtype=np.uint8)
     
-    def render(self, frame: np.ndarray, detection_result: dict, 
+    def render(self, frame: np.ndarray, detection_result: DetectionResult, 
                alarm_active: bool, fps: float) -> np.ndarray:
-        """Render camera view with detection overlay"""
+        """
+        Render camera view with detection overlay
+        
+        The returned image is a reused buffer, overwritten by the next call.
+        """
         
         # Resize frame to display size
-        display = cv2.resize(frame, (self.width, self.height))
+        display = cv2.resize(frame, (self.width, self.height), dst=self._display_buf)
+        
+        # Mirror the small display image rather than the full camera frame;
+        # overlays are drawn afterwards so text stays readable
+        if self.mirror:
+            cv2.flip(display, 1, dst=display)
         
         # Scale factor for bounding boxes
         scale_x = self.width / frame.shape[1]
         scale_y = self.height / frame.shape[0]
         
         # Draw fire regions
-        if detection_result['fire_detected']:
+        if detection_result.fire_detected:
+            # Scale all boxes at once into corners clipped to the display
+            boxes = detection_result.boxes_xywh
+            if self.mirror:
+                boxes = boxes.copy()
+                boxes[:, 0] = frame.shape[1] - boxes[:, 0] - boxes[:, 2]
+            if NUMBA_AVAILABLE:
+                corners = _scale_clip_boxes(boxes, scale_x, scale_y,
+                                            self.width, self.height)
+            else:
+                scale = np.array([scale_x, scale_y, scale_x, scale_y])
+                scaled = (boxes * scale).astype(np.int32)
+                scaled[:, 2:] += scaled[:, :2]
+                corners = np.clip(scaled, 0, [self.width, self.height] * 2)
+            
             # Draw bounding boxes
-            for (x, y, w, h) in detection_result['bounding_boxes']:
-                # Scale coordinates
-                sx = int(x * scale_x)
-                sy = int(y * scale_y)
-                sw = int(w * scale_x)
-                sh = int(h * scale_y)
-                
+            for x0, y0, x1, y1 in corners.tolist():
                 # Draw box with pulsing effect when alarm active
                 if alarm_active:
                     self.flash_counter += 1
-                    thickness = 3 if self.flash_counter % 10 < 5 else 2
-                    color = (0, 0, 255) if self.flash_counter % 20 < 10 else (0, 100, 255)
+                    thickness, color = self._alarm_box_styles[(self.flash_counter // 5) & 3]
                 else:
                     thickness = 2
-                    color = (0, 165, 255)  # Orange
+                    color = ORANGE
                 
-                cv2.rectangle(display, (sx, sy), (sx + sw, sy + sh), color, thickness)
+                cv2.rectangle(display, (x0, y0), (x1, y1), color, thickness)
                 
                 # Draw "FIRE" label
-                label = "FIRE"
-                label_size = cv2.getTextSize(label, cv2.FONT_HERSHEY_SIMPLEX, 0.6, 2)[0]
-                cv2.rectangle(display, (sx, sy - 25), (sx + label_size[0] + 10, sy), color, -1)
-                cv2.putText(display, label, (sx + 5, sy - 7),
-                           cv2.FONT_HERSHEY_SIMPLEX, 0.6, (255, 255, 255), 2)
+                blit_image(display, self._label_sprites[color], x0, y0 - 25)
         
         # Draw header bar
         self._draw_header(display, detection_result, alarm_active, fps)
@@ -477,89 +864,86 @@ class CameraViewRenderer:
         
         return display
     
-    def _draw_header(self, display: np.ndarray, detection_result: dict,
+    def _draw_header(self, display: np.ndarray, detection_result: DetectionResult,
                      alarm_active: bool, fps: float):
         """Draw header with status information"""
         # Semi-transparent header background
-        overlay = display.copy()
-        cv2.rectangle(overlay, (0, 0), (self.width, 60), (30, 30, 30), -1)
-        cv2.addWeighted(overlay, 0.7, display, 0.3, 0, display)
+        strip = display[:61]
+        cv2.addWeighted(strip, 0.3, self._header_bg, 0.7, 0, dst=strip)
         
         # Title
-        cv2.putText(display, "FIRE DETECTION - CAMERA FEED", (15, 35),
-                   cv2.FONT_HERSHEY_SIMPLEX, 0.7, (255, 255, 255), 2)
+        blit_text(display, self._title_text)
         
         # FPS
-        fps_color = (100, 255, 100) if fps > 20 else (100, 100, 255)
+        fps_color = LIGHT_GREEN if fps > 20 else LIGHT_RED
         cv2.putText(display, f"FPS: {fps:.0f}", (self.width - 100, 35),
-                   cv2.FONT_HERSHEY_SIMPLEX, 0.5, fps_color, 1)
+                   FONT, 0.5, fps_color, 1)
         
         # Detection indicator
-        if detection_result['fire_detected']:
-            status_color = (0, 0, 255) if alarm_active else (0, 165, 255)
+        if detection_result.fire_detected:
+            status_color = RED if alarm_active else ORANGE
             cv2.circle(display, (self.width - 130, 30), 8, status_color, -1)
         else:
-            cv2.circle(display, (self.width - 130, 30), 8, (100, 100, 100), -1)
+            cv2.circle(display, (self.width - 130, 30), 8, DIM_GRAY, -1)
     
-    def _draw_footer(self, display: np.ndarray, detection_result: dict,
+    def _draw_footer(self, display: np.ndarray, detection_result: DetectionResult,
                      alarm_active: bool):
         """Draw footer with detailed status"""
-        footer_y = self.height - 70
+        footer_y = self._footer_y
         
         # Semi-transparent footer background
-        overlay = display.copy()
-        cv2.rectangle(overlay, (0, footer_y), (self.width, self.height), (30, 30, 30), -1)
-        cv2.addWeighted(overlay, 0.7, display, 0.3, 0, display)
+        strip = display[footer_y:]
+        cv2.addWeighted(strip, 0.3, self._footer_bg, 0.7, 0, dst=strip)
         
         # Status text
         if alarm_active:
             status = "!! FIRE ALARM ACTIVE !!"
-            status_color = (0, 0, 255)
-        elif detection_result['fire_detected']:
+            status_color = RED
+        elif detection_result.fire_detected:
             status = "Fire Detected - Confirming..."
-            status_color = (0, 165, 255)
+            status_color = ORANGE
         else:
             status = "No Fire Detected"
-            status_color = (100, 255, 100)
+            status_color = LIGHT_GREEN
         
         cv2.putText(display, status, (15, footer_y + 25),
-                   cv2.FONT_HERSHEY_SIMPLEX, 0.6, status_color, 2)
+                   FONT, 0.6, status_color, 2)
         
         # Confidence bar
-        confidence = detection_result['confidence']
+        confidence = detection_result.confidence
         bar_width = 200
         bar_height = 15
         bar_x = 15
         bar_y = footer_y + 40
         
+        # Filled rectangles include both corners, hence the +1 on slice ends
+        bar = display[bar_y:bar_y + bar_height + 1, bar_x:bar_x + bar_width + 1]
+        
         # Background
-        cv2.rectangle(display, (bar_x, bar_y), (bar_x + bar_width, bar_y + bar_height),
-                     (60, 60, 60), -1)
+        bar[:] = DARK_GRAY
         
         # Fill based on confidence
         if confidence > 0:
             fill_width = int(bar_width * confidence)
             # Color gradient based on confidence
             if confidence < 0.3:
-                fill_color = (100, 200, 100)  # Green
+                fill_color = GREEN
             elif confidence < 0.6:
-                fill_color = (0, 200, 255)    # Yellow
+                fill_color = YELLOW
             else:
-                fill_color = (0, 0, 255)      # Red
-            cv2.rectangle(display, (bar_x, bar_y), (bar_x + fill_width, bar_y + bar_height),
-                         fill_color, -1)
+                fill_color = RED
+            bar[:, :fill_width + 1] = fill_color
         
         cv2.putText(display, f"Confidence: {confidence*100:.0f}%", (bar_x + bar_width + 10, bar_y + 12),
-                   cv2.FONT_HERSHEY_SIMPLEX, 0.4, (180, 180, 180), 1)
+                   FONT, 0.4, LIGHT_GRAY, 1)
         
         # Fire area info
-        fire_area = detection_result['fire_area']
+        fire_area = detection_result.fire_area
         cv2.putText(display, f"Fire Area: {fire_area} px", (self.width - 180, footer_y + 25),
-                   cv2.FONT_HERSHEY_SIMPLEX, 0.4, (180, 180, 180), 1)
+                   FONT, 0.4, LIGHT_GRAY, 1)
         
         # Controls hint
-        cv2.putText(display, "Q:Quit  S:Sound  R:Reset", (self.width - 200, footer_y + 50),
-                   cv2.FONT_HERSHEY_SIMPLEX, 0.35, (120, 120, 120), 1)
+        blit_text(display, self._controls_text)
 
 
 # ============================================================================
@@ -577,20 +961,115 @@ class AlarmStatusRenderer:
         self.height = height
         self.flash_phase = 0
         self.pulse_phase = 0
+        
+        # Title bars are cached per (title, color) the first time they're drawn
+        self._title_bars = {}
+        
+        # Sound indicator text for both states, rasterized once
+        bounds = (height, width)
+        sound_org = (width - 80, height - 40)
+        self._sound_on_text = prerender_text("Sound: ON", sound_org,
+                                             0.4, GREEN, 1, bounds)
+        self._sound_off_text = prerender_text("Sound: OFF", sound_org,
+                                              0.4, MUTED_RED, 1, bounds)
+        
+        # Left edges that center the fixed status strings, measured once
+        self._normal_text_x = self._centered_x("SYSTEM NORMAL", 1.2, 3)
+        self._normal_sub_x = self._centered_x("No fire detected", 0.6, 1)
+        self._fire_text_x = self._centered_x("FIRE DETECTED", 1.0, 2)
+        self._fire_sub_x = self._centered_x("Confirming detection...", 0.5, 1)
+        self._alert_text_x = self._centered_x("FIRE ALERT", 1.8, 4)
+        self._warning_x = self._centered_x("EVACUATE IMMEDIATELY", 0.7, 2)
+        
+        # Flame icon polygons relative to the icon center, plus working
+        # buffers that are shifted into place each frame
+        self._flame_outer = np.array([[0, -50], [-30, 20], [-15, 0],
+                                      [0, 30], [15, 0], [30, 20]], np.int32)
+        self._flame_inner = np.array([[0, -30], [-15, 10], [0, 20], [15, 10]], np.int32)
+        self._flame_core = np.array([[0, -10], [-8, 10], [0, 15], [8, 10]], np.int32)
+        self._flame_pts = [np.empty_like(self._flame_outer),
+                           np.empty_like(self._flame_inner),
+                           np.empty_like(self._flame_core)]
+        
+        # Render target reused by the animated (fire / alarm) states
+        self._canvas = np.empty((height, width, 3), dtype=np.uint8)
+        
+        # Last rendered normal-state canvas and the state it was drawn for
+        self._last_key = None
+        self._last_canvas = None
+        
+        # Fully drawn static scenes (without the sound indicator), built lazily
+        self._normal_canvas = None
+        self._fire_canvas = None
+        
+        # Vertical position of each row as a fraction of the height, shaped
+        # (H, 1, 1) so gradients broadcast across columns and channels
+        self._ratio_col = (np.arange(height) / height)[:, None, None]
+        
+        # The normal and fire-detected gradients never change, build them once
+        ratio = self._ratio_col
+        self._normal_grad = self._gradient(
+            20 * (1 - ratio) + 30 * ratio,
+            30 * (1 - ratio) + 40 * ratio,
+            20 * (1 - ratio) + 30 * ratio,
+        )
+        self._fire_grad = self._gradient(
+            10 + 5 * ratio,
+            25 + 10 * ratio,
+            40 + 20 * ratio,
+        )
+        
+        # The alarm background only switches between two base colors, so
+        # both are prebuilt and scaled by the pulse intensity per frame
+        self._alarm_grad_flash = self._gradient(10, 10, 60 * (1 + ratio * 0.5))
+        self._alarm_grad_noflash = self._gradient(5, 5, 30 * (1 + ratio * 0.5))
+    
+    def _centered_x(self, text: str, font_scale: float, thickness: int) -> int:
+        """Return the x origin that horizontally centers text on the canvas"""
+        text_w = cv2.getTextSize(text, FONT, font_scale, thickness)[0][0]
+        return (self.width - text_w) // 2
+    
+    def _gradient(self, b, g, r) -> np.ndarray:
+        """
+        Build a full-size vertical gradient from per-row channel values
+        
+        Args:
+            b, g, r: Channel values, scalars or (H, 1, 1) arrays
+            
+        Returns:
+            (H, W, 3) uint8 image with each row filled with its color
+        """
+        column = np.concatenate(np.broadcast_arrays(b, g, r), axis=2)
+        canvas = np.empty((self.height, self.width, 3), dtype=np.uint8)
+        canvas[:] = np.minimum(column, 255).astype(np.uint8)
+        return canvas
     
     def render(self, alarm_active: bool, fire_detected: bool, 
                sound_enabled: bool) -> np.ndarray:
-        """Render alarm status display"""
+        """
+        Render alarm status display
+        
+        The normal state is static, so its canvas is cached and only redrawn
+        when the sound setting changes. The animated states draw into one
+        reused buffer. Treat the returned image as read-only and valid only
+        until the next call.
+        """
         
         self.flash_phase += 1
         self.pulse_phase += 0.1
         
+        if not alarm_active and not fire_detected:
+            key = (False, False, sound_enabled)
+            if key != self._last_key:
+                self._last_canvas = self._render_normal()
+                self._draw_sound_indicator(self._last_canvas, sound_enabled)
+                self._last_key = key
+            return self._last_canvas
+        
         if alarm_active:
             canvas = self._render_alarm_active()
-        elif fire_detected:
-            canvas = self._render_fire_detected()
         else:
-            canvas = self._render_normal()
+            canvas = self._render_fire_detected()
         
         # Draw sound status
         self._draw_sound_indicator(canvas, sound_enabled)
@@ -598,24 +1077,23 @@ class AlarmStatusRenderer:
         return canvas
     
     def _render_normal(self) -> np.ndarray:
-        """Render normal (no fire) state"""
-        # Create dark gradient background
-        canvas = np.zeros((self.height, self.width, 3), dtype=np.uint8)
-        
-        for y in range(self.height):
-            ratio = y / self.height
-            r = int(20 * (1 - ratio) + 30 * ratio)
-            g = int(30 * (1 - ratio) + 40 * ratio)
-            b = int(20 * (1 - ratio) + 30 * ratio)
-            canvas[y, :] = [b, g, r]
+        """Render normal (no fire) state onto a copy of the prebuilt scene"""
+        if self._normal_canvas is None:
+            self._normal_canvas = self._build_normal_canvas()
+        return self._normal_canvas.copy()
+    
+    def _build_normal_canvas(self) -> np.ndarray:
+        """Draw the static normal (no fire) scene"""
+        # Start from the cached dark gradient background
+        canvas = self._normal_grad.copy()
         
         # Draw checkmark icon
         center_x = self.width // 2
         center_y = self.height // 2 - 40
         
         # Circle background
-        cv2.circle(canvas, (center_x, center_y), 60, (50, 100, 50), -1)
-        cv2.circle(canvas, (center_x, center_y), 60, (100, 200, 100), 3)
+        cv2.circle(canvas, (center_x, center_y), 60, DARK_GREEN, -1)
+        cv2.circle(canvas, (center_x, center_y), 60, GREEN, 3)
         
         # Checkmark
         pts = np.array([
@@ -623,84 +1101,61 @@ class AlarmStatusRenderer:
             [center_x - 10, center_y + 25],
             [center_x + 35, center_y - 25]
         ], np.int32)
-        cv2.polylines(canvas, [pts], False, (100, 255, 100), 6, cv2.LINE_AA)
+        cv2.polylines(canvas, [pts], False, LIGHT_GREEN, 6, cv2.LINE_AA)
         
         # Status text
-        text = "SYSTEM NORMAL"
-        text_size = cv2.getTextSize(text, cv2.FONT_HERSHEY_SIMPLEX, 1.2, 3)[0]
-        text_x = (self.width - text_size[0]) // 2
-        cv2.putText(canvas, text, (text_x, center_y + 120),
-                   cv2.FONT_HERSHEY_SIMPLEX, 1.2, (100, 200, 100), 3)
+        cv2.putText(canvas, "SYSTEM NORMAL", (self._normal_text_x, center_y + 120),
+                   FONT, 1.2, GREEN, 3)
         
         # Subtitle
-        subtitle = "No fire detected"
-        sub_size = cv2.getTextSize(subtitle, cv2.FONT_HERSHEY_SIMPLEX, 0.6, 1)[0]
-        sub_x = (self.width - sub_size[0]) // 2
-        cv2.putText(canvas, subtitle, (sub_x, center_y + 155),
-                   cv2.FONT_HERSHEY_SIMPLEX, 0.6, (150, 150, 150), 1)
+        cv2.putText(canvas, "No fire detected", (self._normal_sub_x, center_y + 155),
+                   FONT, 0.6, MID_GRAY, 1)
         
         # Title bar
-        self._draw_title(canvas, "Fire Alarm Status", (100, 200, 100))
+        self._draw_title(canvas, "Fire Alarm Status", GREEN)
         
         return canvas
     
     def _render_fire_detected(self) -> np.ndarray:
         """Render fire detected but alarm not yet triggered"""
-        canvas = np.zeros((self.height, self.width, 3), dtype=np.uint8)
-        
+        # Nothing animates in this state, so stamp the prebuilt scene
+        if self._fire_canvas is None:
+            self._fire_canvas = self._build_fire_canvas()
+        np.copyto(self._canvas, self._fire_canvas)
+        return self._canvas
+    
+    def _build_fire_canvas(self) -> np.ndarray:
+        """Draw the static fire-detected scene"""
         # Orange-ish gradient
-        for y in range(self.height):
-            ratio = y / self.height
-            r = int(40 + 20 * ratio)
-            g = int(25 + 10 * ratio)
-            b = int(10 + 5 * ratio)
-            canvas[y, :] = [b, g, r]
+        canvas = self._fire_grad.copy()
         
         center_x = self.width // 2
         center_y = self.height // 2 - 20
         
         # Warning icon
-        cv2.circle(canvas, (center_x, center_y), 50, (0, 165, 255), -1)
+        cv2.circle(canvas, (center_x, center_y), 50, ORANGE, -1)
         cv2.putText(canvas, "!", (center_x - 12, center_y + 20),
-                   cv2.FONT_HERSHEY_SIMPLEX, 2, (255, 255, 255), 5)
+                   FONT, 2, WHITE, 5)
         
         # Status text
-        text = "FIRE DETECTED"
-        text_size = cv2.getTextSize(text, cv2.FONT_HERSHEY_SIMPLEX, 1.0, 2)[0]
-        text_x = (self.width - text_size[0]) // 2
-        cv2.putText(canvas, text, (text_x, center_y + 100),
-                   cv2.FONT_HERSHEY_SIMPLEX, 1.0, (0, 200, 255), 2)
+        cv2.putText(canvas, "FIRE DETECTED", (self._fire_text_x, center_y + 100),
+                   FONT, 1.0, YELLOW, 2)
         
-        subtitle = "Confirming detection..."
-        sub_size = cv2.getTextSize(subtitle, cv2.FONT_HERSHEY_SIMPLEX, 0.5, 1)[0]
-        sub_x = (self.width - sub_size[0]) // 2
-        cv2.putText(canvas, subtitle, (sub_x, center_y + 130),
-                   cv2.FONT_HERSHEY_SIMPLEX, 0.5, (180, 150, 100), 1)
+        cv2.putText(canvas, "Confirming detection...", (self._fire_sub_x, center_y + 130),
+                   FONT, 0.5, STEEL_BLUE, 1)
         
-        self._draw_title(canvas, "Fire Alarm Status", (0, 165, 255))
+        self._draw_title(canvas, "Fire Alarm Status", ORANGE)
         
         return canvas
     
     def _render_alarm_active(self) -> np.ndarray:
         """Render active alarm state with flashing effect"""
-        canvas = np.zeros((self.height, self.width, 3), dtype=np.uint8)
-        
         # Flashing red background
         flash = (self.flash_phase % 20) < 10
         pulse = (np.sin(self.pulse_phase) + 1) / 2
         
-        if flash:
-            base_r, base_g, base_b = 60, 10, 10
-        else:
-            base_r, base_g, base_b = 30, 5, 5
-        
-        for y in range(self.height):
-            ratio = y / self.height
-            intensity = 1 + pulse * 0.3
-            r = int(base_r * intensity * (1 + ratio * 0.5))
-            g = int(base_g * intensity)
-            b = int(base_b * intensity)
-            canvas[y, :] = [min(b, 255), min(g, 255), min(r, 255)]
+        base = self._alarm_grad_flash if flash else self._alarm_grad_noflash
+        canvas = cv2.convertScaleAbs(base, dst=self._canvas, alpha=1 + pulse * 0.3)
         
         center_x = self.width // 2
         center_y = self.height // 2 - 30
@@ -710,85 +1165,162 @@ class AlarmStatusRenderer:
         
         # FIRE ALERT text with glow effect
         alert_text = "FIRE ALERT"
-        text_size = cv2.getTextSize(alert_text, cv2.FONT_HERSHEY_SIMPLEX, 1.8, 4)[0]
-        text_x = (self.width - text_size[0]) // 2
+        text_x = self._alert_text_x
         text_y = center_y + 80
         
         # Glow
-        glow_color = (0, 100, 200) if flash else (0, 50, 150)
+        glow_color = DARK_ORANGE if flash else BURNT_ORANGE
         cv2.putText(canvas, alert_text, (text_x - 2, text_y + 2),
-                   cv2.FONT_HERSHEY_SIMPLEX, 1.8, glow_color, 8)
+                   FONT, 1.8, glow_color, 8)
         
         # Main text
-        text_color = (0, 0, 255) if flash else (0, 50, 200)
+        text_color = RED if flash else DIM_ORANGE_RED
         cv2.putText(canvas, alert_text, (text_x, text_y),
-                   cv2.FONT_HERSHEY_SIMPLEX, 1.8, text_color, 4)
+                   FONT, 1.8, text_color, 4)
         
         # Warning message
-        warning = "EVACUATE IMMEDIATELY"
-        warn_size = cv2.getTextSize(warning, cv2.FONT_HERSHEY_SIMPLEX, 0.7, 2)[0]
-        warn_x = (self.width - warn_size[0]) // 2
-        cv2.putText(canvas, warning, (warn_x, text_y + 50),
-                   cv2.FONT_HERSHEY_SIMPLEX, 0.7, (200, 200, 200), 2)
+        cv2.putText(canvas, "EVACUATE IMMEDIATELY", (self._warning_x, text_y + 50),
+                   FONT, 0.7, SILVER, 2)
         
         # Flashing border
-        border_color = (0, 0, 255) if flash else (0, 0, 150)
+        border_color = RED if flash else DARK_RED
         cv2.rectangle(canvas, (5, 5), (self.width - 5, self.height - 5), border_color, 4)
         
-        self._draw_title(canvas, "!! FIRE ALARM !!", (0, 0, 255))
+        self._draw_title(canvas, "!! FIRE ALARM !!", RED)
         
         return canvas
     
     def _draw_flame_icon(self, canvas: np.ndarray, cx: int, cy: int, pulse: float):
         """Draw a simple flame icon"""
-        # Outer flame (orange)
-        pts_outer = np.array([
-            [cx, cy - 50 - int(pulse * 10)],
-            [cx - 30, cy + 20],
-            [cx - 15, cy],
-            [cx, cy + 30],
-            [cx + 15, cy],
-            [cx + 30, cy + 20],
-        ], np.int32)
-        cv2.fillPoly(canvas, [pts_outer], (0, 100, 255))
-        
-        # Inner flame (yellow)
-        pts_inner = np.array([
-            [cx, cy - 30 - int(pulse * 5)],
-            [cx - 15, cy + 10],
-            [cx, cy + 20],
-            [cx + 15, cy + 10],
-        ], np.int32)
-        cv2.fillPoly(canvas, [pts_inner], (0, 200, 255))
-        
-        # Core (white-yellow)
-        pts_core = np.array([
-            [cx, cy - 10],
-            [cx - 8, cy + 10],
-            [cx, cy + 15],
-            [cx + 8, cy + 10],
-        ], np.int32)
-        cv2.fillPoly(canvas, [pts_core], (150, 255, 255))
+        # Shift the template polygons to the icon center in place
+        offset = (cx, cy)
+        np.add(self._flame_outer, offset, out=self._flame_pts[0])
+        np.add(self._flame_inner, offset, out=self._flame_pts[1])
+        np.add(self._flame_core, offset, out=self._flame_pts[2])
+        
+        # Only the flame tips move with the pulse
+        self._flame_pts[0][0, 1] -= int(pulse * 10)
+        self._flame_pts[1][0, 1] -= int(pulse * 5)
+        
+        # Outer flame (orange), inner flame (yellow), core (white-yellow)
+        cv2.fillPoly(canvas, self._flame_pts[:1], ORANGE_RED)
+        cv2.fillPoly(canvas, self._flame_pts[1:2], YELLOW)
+        cv2.fillPoly(canvas, self._flame_pts[2:], PALE_YELLOW)
     
     def _draw_title(self, canvas: np.ndarray, title: str, color: tuple):
         """Draw title bar"""
-        cv2.rectangle(canvas, (0, 0), (self.width, 50), (20, 20, 20), -1)
-        
-        text_size = cv2.getTextSize(title, cv2.FONT_HERSHEY_SIMPLEX, 0.8, 2)[0]
-        text_x = (self.width - text_size[0]) // 2
-        cv2.putText(canvas, title, (text_x, 35),
-                   cv2.FONT_HERSHEY_SIMPLEX, 0.8, color, 2)
+        bar = self._title_bars.get((title, color))
+        if bar is None:
+            # Opaque bar (rows 0-50) with the title drawn in, built once
+            bar = np.full((51, self.width, 3), 20, dtype=np.uint8)
+            text_size = cv2.getTextSize(title, FONT, 0.8, 2)[0]
+            text_x = (self.width - text_size[0]) // 2
+            cv2.putText(bar, title, (text_x, 35),
+                       FONT, 0.8, color, 2)
+            self._title_bars[(title, color)] = bar
+        
+        canvas[:bar.shape[0]] = bar
     
     def _draw_sound_indicator(self, canvas: np.ndarray, sound_enabled: bool):
         """Draw sound on/off indicator"""
-        x, y = self.width - 80, self.height - 40
-        
-        if sound_enabled:
-            cv2.putText(canvas, "Sound: ON", (x, y),
-                       cv2.FONT_HERSHEY_SIMPLEX, 0.4, (100, 200, 100), 1)
-        else:
-            cv2.putText(canvas, "Sound: OFF", (x, y),
-                       cv2.FONT_HERSHEY_SIMPLEX, 0.4, (100, 100, 200), 1)
+        blit_text(canvas, self._sound_on_text if sound_enabled else self._sound_off_text)
+
+
+# ============================================================================
+# CAPTURE / DETECTION THREADS
+# ============================================================================
+
+def _put_latest(q: queue.Queue, item):
+    """Put item into a bounded queue, dropping the oldest entry if it is full"""
+    while True:
+        try:
+            q.put_nowait(item)
+            return
+        except queue.Full:
+            try:
+                q.get_nowait()
+            except queue.Empty:
+                pass
+
+
+class CaptureThread(Thread):
+    """
+    Grabs frames from the camera and publishes only the most recent one.
+    Stale frames are dropped so detection never falls behind the camera.
+    """
+    
+    def __init__(self, cap, stop_event: Event):
+        super().__init__(daemon=True)
+        self.cap = cap
+        self.stop_event = stop_event
+        self.frames = queue.Queue(maxsize=1)
+    
+    def run(self):
+        # Any exit, including an unexpected error, stops the whole pipeline
+        try:
+            while not self.stop_event.is_set():
+                ret, frame = self.cap.read()
+                if not ret:
+                    print("Error: Failed to capture frame")
+                    break
+                
+                _put_latest(self.frames, frame)
+        except Exception:
+            print("Error: Capture thread failed")
+            traceback.print_exc()
+        finally:
+            self.stop_event.set()
+
+
+class DetectorThread(Thread):
+    """
+    Runs fire detection on the latest captured frame and publishes
+    (generation, frame, detection_result, fire_confirmed) for the render loop.
+    
+    The detector is only touched from this thread. A reset requested by the
+    main thread bumps generation and is applied here before the next
+    detection; results tagged with an older generation are stale.
+    """
+    
+    def __init__(self, detector: FireDetector, frames: queue.Queue, stop_event: Event):
+        super().__init__(daemon=True)
+        self.detector = detector
+        self.frames = frames
+        self.stop_event = stop_event
+        self.results = queue.Queue(maxsize=1)
+        self.reset_event = Event()
+        self.generation = 0  # Only written by the main thread
+    
+    def request_reset(self):
+        """Ask for a detector reset; everything published before it is stale"""
+        self.generation += 1
+        self.reset_event.set()
+    
+    def run(self):
+        # Any exit, including an unexpected error, stops the whole pipeline
+        try:
+            generation = self.generation
+            while not self.stop_event.is_set():
+                try:
+                    frame = self.frames.get(timeout=0.1)
+                except queue.Empty:
+                    continue
+                
+                # Clear before reading generation so a reset that arrives in
+                # between is applied again on the next frame, never lost
+                if self.reset_event.is_set():
+                    self.reset_event.clear()
+                    generation = self.generation
+                    self.detector.reset()
+                
+                detection_result = self.detector.detect(frame)
+                fire_confirmed = self.detector.is_fire_confirmed()
+                _put_latest(self.results, (generation, frame, detection_result, fire_confirmed))
+        except Exception:
+            print("Error: Detection thread failed")
+            traceback.print_exc()
+        finally:
+            self.stop_event.set()
 
 
 # ============================================================================
@@ -822,15 +1354,44 @@ class FireAlarmSystem:
         
         # Initialize components
         self.detector = FireDetector()
-        self.alarm_manager = AlarmManager(ALARM_SOUND_PATH)
+        self.alarm_manager = AlarmManager(ALARM_SOUND_PATH, ALARM_SOUND_EXISTS)
         
         # Initialize renderers
         self.camera_renderer = CameraViewRenderer(DISPLAY_WIDTH, DISPLAY_HEIGHT)
         self.alarm_renderer = AlarmStatusRenderer(ALARM_DISPLAY_WIDTH, ALARM_DISPLAY_HEIGHT)
         
+        # Side-by-side buffer both views are copied into in single-window mode
+        self._composite = None
+        if SINGLE_WINDOW:
+            self._composite = np.zeros(
+                (max(DISPLAY_HEIGHT, ALARM_DISPLAY_HEIGHT),
+                 DISPLAY_WIDTH + ALARM_DISPLAY_WIDTH, 3), dtype=np.uint8
+            )
+        
+        # Compile the box scaling kernel now so the first fire isn't delayed
+        if NUMBA_AVAILABLE:
+            _scale_clip_boxes(np.zeros((1, 4), dtype=np.int32), 1.0, 1.0,
+                              DISPLAY_WIDTH, DISPLAY_HEIGHT)
+        
+        # Capture and detection run on their own threads; this one renders
+        # the camera view while the alarm view renders on a pool worker
+        self._render_pool = ThreadPoolExecutor(max_workers=1)
+        self._stop_event = Event()
+        self.capture_thread = CaptureThread(self.cap, self._stop_event)
+        self.detector_thread = DetectorThread(
+            self.detector, self.capture_thread.frames, self._stop_event
+        )
+        
+        # pollKey (OpenCV >= 4.5) services window events without the
+        # minimum 1 ms sleep of waitKey(1)
+        if hasattr(cv2, "pollKey"):
+            self._poll_key = cv2.pollKey
+        else:
+            self._poll_key = lambda: cv2.waitKey(1)
+        
         # State
         self.running = True
-        self.fps_history = deque(maxlen=30)
+        self.fps_ema = 0.0  # Exponential moving average of the frame rate
         
         print("✓ System ready")
         print("=" * 60)
@@ -839,63 +1400,83 @@ class FireAlarmSystem:
         """Main application loop"""
         self._print_instructions()
         
+        self.capture_thread.start()
+        self.detector_thread.start()
+        frame_start = time.time()
+        
         while self.running:
-            frame_start = time.time()
-            
-            # Capture frame
-            ret, frame = self.cap.read()
-            if not ret:
-                print("Error: Failed to capture frame")
-                break
-            
-            # Flip for mirror effect (optional)
-            frame = cv2.flip(frame, 1)
-            
-            # Detect fire
-            detection_result = self.detector.detect(frame)
+            # Wait for the next detected frame
+            try:
+                generation, frame, detection_result, fire_confirmed = \
+                    self.detector_thread.results.get(timeout=0.1)
+            except queue.Empty:
+                if self._stop_event.is_set():
+                    break
+                # Keep the windows responsive while the pipeline is stalled
+                self._handle_key()
+                continue
             
-            # Check if fire is confirmed (multiple consecutive frames)
-            fire_confirmed = self.detector.is_fire_confirmed()
+            # Drop results detected before the last reset so they can't
+            # re-trigger the alarm the user just stopped
+            if generation != self.detector_thread.generation:
+                continue
             
             # Update alarm state
             self.alarm_manager.update(fire_confirmed)
             
             # Calculate FPS
-            frame_time = time.time() - frame_start
-            self.fps_history.append(1.0 / max(frame_time, 0.001))
-            fps = np.mean(self.fps_history)
+            now = time.time()
+            frame_time = now - frame_start
+            frame_start = now
+            inst_fps = 1.0 / max(frame_time, 0.001)
+            if self.fps_ema:
+                self.fps_ema = 0.9 * self.fps_ema + 0.1 * inst_fps
+            else:
+                self.fps_ema = inst_fps
+            fps = self.fps_ema
+            
+            # Render alarm status (Screen 2) in the background
+            alarm_future = self._render_pool.submit(
+                self.alarm_renderer.render,
+                self.alarm_manager.alarm_active,
+                detection_result.fire_detected,
+                self.alarm_manager.sound_enabled
+            )
             
             # Render camera view (Screen 1)
             camera_display = self.camera_renderer.render(
                 frame, detection_result, 
                 self.alarm_manager.alarm_active, fps
             )
-            
-            # Render alarm status (Screen 2)
-            alarm_display = self.alarm_renderer.render(
-                self.alarm_manager.alarm_active,
-                detection_result['fire_detected'],
-                self.alarm_manager.sound_enabled
-            )
+            alarm_display = alarm_future.result()
             
             # Show windows
-            cv2.imshow("Fire Detection - Camera Feed", camera_display)
-            cv2.imshow("Fire Alarm Status", alarm_display)
+            if self._composite is not None:
+                self._composite[:DISPLAY_HEIGHT, :DISPLAY_WIDTH] = camera_display
+                self._composite[:ALARM_DISPLAY_HEIGHT, DISPLAY_WIDTH:] = alarm_display
+                cv2.imshow("Fire Alarm System", self._composite)
+            else:
+                cv2.imshow("Fire Detection - Camera Feed", camera_display)
+                cv2.imshow("Fire Alarm Status", alarm_display)
             
             # Handle keyboard input
-            key = cv2.waitKey(1) & 0xFF
-            if key == ord('q'):
-                self.running = False
-            elif key == ord('s'):
-                enabled = self.alarm_manager.toggle_sound()
-                print(f"Sound {'enabled' if enabled else 'disabled'}")
-            elif key == ord('r'):
-                self.detector.reset()
-                self.alarm_manager.stop_alarm()
-                print("System reset")
+            self._handle_key()
         
         self.cleanup()
     
+    def _handle_key(self):
+        """Service window events and act on Q/S/R key presses"""
+        key = self._poll_key() & 0xFF
+        if key == ord('q'):
+            self.running = False
+        elif key == ord('s'):
+            enabled = self.alarm_manager.toggle_sound()
+            print(f"Sound {'enabled' if enabled else 'disabled'}")
+        elif key == ord('r'):
+            self.detector_thread.request_reset()
+            self.alarm_manager.stop_alarm()
+            print("System reset")
+    
     def _print_instructions(self):
         """Print usage instructions"""
         print("\nCONTROLS:")
@@ -903,6 +1484,8 @@ class FireAlarmSystem:
         print("  S - Toggle alarm sound on/off")
         print("  R - Reset detection and stop alarm")
         print("\nWINDOWS:")
+        if SINGLE_WINDOW:
+            print("  Fire Alarm System (both views side by side)")
         print("  [1] Fire Detection - Camera Feed")
         print("      Shows live video with detection overlay")
         print("  [2] Fire Alarm Status")
@@ -916,8 +1499,18 @@ class FireAlarmSystem:
     def cleanup(self):
         """Clean up resources"""
         print("\nShutting down...")
+        self._stop_event.set()
+        for thread in (self.capture_thread, self.detector_thread):
+            if thread.is_alive():
+                thread.join(timeout=1.0)
+        self._render_pool.shutdown(wait=True)
         self.alarm_manager.cleanup()
-        self.cap.release()
+        # Releasing the camera during a blocking read() is unsafe; if the
+        # capture thread is still stuck in one, leave it to process exit
+        if self.capture_thread.is_alive():
+            print("Warning: capture thread still running, camera not released")
+        else:
+            self.cap.release()
         cv2.destroyAllWindows()
         print("✓ Application closed")
 
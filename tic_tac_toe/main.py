@@ -1,83 +1,194 @@
 import tkinter as tk
 from tkinter import messagebox
 
+# ---------- BITBOARDS ----------
+WINNING_COMBINATIONS = (
+    (0,1,2), (3,4,5), (6,7,8),
+    (0,3,6), (1,4,7), (2,5,8),
+    (0,4,8), (2,4,6)
+)
+
+# Each player's pieces are a 9-bit int: bit i is set when cell i is taken
+WIN_MASKS = tuple(sum(1 << i for i in combo) for combo in WINNING_COMBINATIONS)
+
+# (combo, mask) pairs for the 2-4 winning lines that pass through each cell
+LINES_THROUGH = tuple(
+    tuple((combo, mask) for combo, mask in zip(WINNING_COMBINATIONS, WIN_MASKS) if i in combo)
+    for i in range(9)
+)
+
+CELL = 120  # Side of one board cell on the canvas, in pixels
+
+# ---------- GAME TREE ----------
+# Outcome ("X", "O" or "tie") of every finished position reachable in play,
+# keyed by (board_x, board_o); positions still in play are absent
+TERMINAL = {}
+
+# Optimal cell for the player to move, keyed by (board_x, board_o, player)
+BEST_MOVE = {}
+
+
+def _outcome(bx, bo):
+    """Return "X", "O" or "tie" for a finished position, otherwise None"""
+    for mask in WIN_MASKS:
+        if (bx & mask) == mask:
+            return "X"
+        if (bo & mask) == mask:
+            return "O"
+    if (bx | bo) == 0b111111111:
+        return "tie"
+    return None
+
+
+def _solve(bx, bo, player, scores):
+    """
+    Search every continuation of a position, filling TERMINAL and BEST_MOVE.
+    Returns +1 if player (to move) can force a win, 0 for a tie, -1 for a loss.
+    """
+    key = (bx, bo, player)
+    if key in scores:
+        return scores[key]
+
+    result = _outcome(bx, bo)
+    if result is not None:
+        TERMINAL[(bx, bo)] = result
+        score = 0 if result == "tie" else -1  # The previous player just won
+    else:
+        other = "O" if player == "X" else "X"
+        taken = bx | bo
+        score = -2
+        for i in range(9):
+            if taken >> i & 1:
+                continue
+            if player == "X":
+                move_score = -_solve(bx | 1 << i, bo, other, scores)
+            else:
+                move_score = -_solve(bx, bo | 1 << i, other, scores)
+            if move_score > score:
+                score = move_score
+                BEST_MOVE[key] = i
+
+    scores[key] = score
+    return score
+
+
+# Either player may open a game, so explore both starts
+_scores = {}
+_solve(0, 0, "X", _scores)
+_solve(0, 0, "O", _scores)
+del _scores
+
 # ---------- PROGRAM ----------
-def reset_game():
-    """Reset the board for a new game"""
-    global current_player, winner
-    for button in buttons:
-        button.config(text="", bg="SystemButtonFace")
-    current_player = "X"
-    winner = False
-    label.config(text=f"Player {current_player}'s turn")
-
-def check_winner():
-    """Check if a player has won or if it's a tie"""
-    global winner
-    winning_combinations = [
-        (0,1,2), (3,4,5), (6,7,8),
-        (0,3,6), (1,4,7), (2,5,8),
-        (0,4,8), (2,4,6)
-    ]
-    
-
-    for combo in winning_combinations:
-        if buttons[combo[0]]["text"] == buttons[combo[1]]["text"] == buttons[combo[2]]["text"] != "":
-            buttons[combo[0]].config(bg="green")
-            buttons[combo[1]].config(bg="green")
-            buttons[combo[2]].config(bg="green")
-            winner = True
-            replay = messagebox.askyesno(
-                "Tic-Tac-Toe", 
-                f"Player {buttons[combo[0]]['text']} wins!\nDo you want to play again?"
-            )
+class Game:
+    """Board state for one Tic-Tac-Toe window and the widgets that show it"""
+
+    __slots__ = ("root", "canvas", "cells", "turn_var", "highlighted",
+                 "current_player", "winner", "board_x", "board_o")
+
+    def __init__(self, root):
+        self.root = root
+        self.current_player = "X"
+        self.winner = False
+        self.board_x = self.board_o = 0
+        self.highlighted = False  # Whether a winning line is painted green
+
+        self.canvas = tk.Canvas(root, width=3 * CELL, height=3 * CELL, highlightthickness=0)
+        self.canvas.grid(row=0, column=0, columnspan=3)
+
+        for k in (1, 2):
+            self.canvas.create_line(k * CELL, 0, k * CELL, 3 * CELL, width=2)
+            self.canvas.create_line(0, k * CELL, 3 * CELL, k * CELL, width=2)
+
+        # One text item per cell, updated in place as the game goes on
+        self.cells = [
+            self.canvas.create_text((i % 3) * CELL + CELL // 2, (i // 3) * CELL + CELL // 2,
+                                    text="", font=("normal", 25)) for i in range(9)
+        ]
+
+        self.canvas.bind("<Button-1>", self.canvas_click)
+
+        self.turn_var = tk.StringVar(value=f"Player {self.current_player}'s turn")
+        label = tk.Label(root, textvariable=self.turn_var, font=("normal",16))
+        label.grid(row=1, column=0, columnspan=3)
+
+    def reset_game(self):
+        """Reset the board for a new game"""
+        # Only touch the cells and highlight this game actually drew
+        taken = self.board_x | self.board_o
+        for i, cell in enumerate(self.cells):
+            if taken >> i & 1:
+                self.canvas.itemconfig(cell, text="")
+        if self.highlighted:
+            self.canvas.delete("highlight")
+            self.highlighted = False
+        self.current_player = "X"
+        self.winner = False
+        self.board_x = self.board_o = 0
+        self.turn_var.set(f"Player {self.current_player}'s turn")
+
+    def check_winner(self, last_idx):
+        """Check if the move at last_idx won the game or filled the board"""
+        result = TERMINAL.get((self.board_x, self.board_o))
+        if result is None:
+            return  # Game still in progress
+
+        # Only the player who just moved can have completed a line, and only
+        # one through the cell they just took
+        board = self.board_x if self.current_player == "X" else self.board_o
+        for combo, mask in LINES_THROUGH[last_idx]:
+            if (board & mask) == mask:
+                for i in combo:
+                    x, y = (i % 3) * CELL, (i // 3) * CELL
+                    self.canvas.create_rectangle(x, y, x + CELL, y + CELL, fill="green",
+                                                 outline="", tags="highlight")
+                self.canvas.tag_lower("highlight")
+                self.highlighted = True
+                # Paint the last mark and the highlight in one pass before the
+                # modal dialog blocks the event loop
+                self.root.update_idletasks()
+                self.winner = True
+                replay = messagebox.askyesno(
+                    "Tic-Tac-Toe", 
+                    f"Player {self.current_player} wins!\nDo you want to play again?"
+                )
+                if replay:
+                    self.reset_game()
+                return
+
+        if result == "tie" and not self.winner:
+            self.winner = True
+            self.root.update_idletasks()
+            replay = messagebox.askyesno("Tic-Tac-Toe", "It's a tie!\nDo you want to play again?")
             if replay:
-                reset_game()
-            return
-
-    
-
-    if all(button["text"] != "" for button in buttons) and not winner:
-        winner = True
-        replay = messagebox.askyesno("Tic-Tac-Toe", "It's a tie!\nDo you want to play again?")
-        if replay:
-            reset_game()
-
-
-def button_click(index):
-    """Handle a button click"""
-    if buttons[index]["text"] == "" and not winner:
-        buttons[index]["text"] = current_player
-        check_winner()
-        toggle_player()
-
-
-def toggle_player():
-    """Switch turns between X and O"""
-    global current_player
-    current_player = "O" if current_player == "X" else "X"
-    label.config(text=f"Player {current_player}'s turn")
+                self.reset_game()
+
+    def canvas_click(self, event):
+        """Translate a click on the board canvas into a cell index"""
+        row, col = event.y // CELL, event.x // CELL
+        if 0 <= row < 3 and 0 <= col < 3:
+            self.button_click(row * 3 + col)
+
+    def button_click(self, index):
+        """Handle a click on a board cell"""
+        if not (self.board_x | self.board_o) >> index & 1 and not self.winner:
+            self.canvas.itemconfig(self.cells[index], text=self.current_player)
+            if self.current_player == "X":
+                self.board_x |= 1 << index
+            else:
+                self.board_o |= 1 << index
+            self.check_winner(index)
+            self.toggle_player()
+
+    def toggle_player(self):
+        """Switch turns between X and O"""
+        self.current_player = "O" if self.current_player == "X" else "X"
+        self.turn_var.set(f"Player {self.current_player}'s turn")
 
 
 root = tk.Tk()
 root.title("Tic-Tac-Toe")
 
-current_player = "X"
-winner = False
-
-
-buttons = [
-    tk.Button(root, text="", font=("normal", 25), width=6, height=2, 
-              command=lambda i=i: button_click(i)) for i in range(9)
-]
-
-
-for i, button in enumerate(buttons):
-    button.grid(row=i//3, column=i%3)
-
-
-label = tk.Label(root, text=f"Player {current_player}'s turn", font=("normal",16))
-label.grid(row=3, column=0, columnspan=3)
+game = Game(root)
 
 
 root.mainloop()